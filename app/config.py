@@ -1,7 +1,5 @@
 """Configuration settings for the auth backend."""
 
-from functools import lru_cache
-
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -35,6 +33,12 @@ class Settings(BaseSettings):
         le=600,
         description="Cleanup expired sessions interval in seconds",
     )
+    token_cache_ttl: int = Field(
+        default=30,
+        ge=0,
+        le=3600,
+        description="Seconds a token is cached in memory for authorization (0 disables caching)",
+    )
     max_response_time: float = Field(
         default=2.5,
         ge=0.1,
@@ -52,6 +56,18 @@ class Settings(BaseSettings):
         default=True,
         description="Enable access logging to database",
     )
+    access_log_flush_interval: int = Field(
+        default=1,
+        ge=1,
+        le=60,
+        description="How often buffered access logs are written to the database in seconds",
+    )
+    access_log_buffer_size: int = Field(
+        default=10_000,
+        ge=100,
+        le=1_000_000,
+        description="Max access log entries held in memory between flushes (oldest dropped when full)",
+    )
 
     # API settings
     api_host: str = Field(
@@ -64,6 +80,12 @@ class Settings(BaseSettings):
         le=65535,
         description="API port",
     )
+    api_workers: int = Field(
+        default=1,
+        ge=1,
+        le=64,
+        description="Number of Uvicorn worker processes",
+    )
 
     # Security
     api_key: str | None = Field(
@@ -72,7 +94,10 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache
+# Loaded once at import; settings don't change for the lifetime of the process
+settings: Settings = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the application settings instance."""
+    return settings
@@ -1,16 +1,46 @@
 """Logging configuration."""
 
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 
 from app.config import get_settings
 
+settings = get_settings()
+
+_LEVEL = logging.getLevelNamesMapping()[settings.log_level]
+_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Logger for per-request authorization messages (hot path)
+access_logger = logging.getLogger("auth.access")
+
 
 def setup_logging() -> None:
-    """Configure application logging using Python defaults."""
-    settings = get_settings()
-
-    # Use default basicConfig with console output only
-    logging.basicConfig(
-        level=getattr(logging, settings.log_level),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    """
+    Configure application logging.
+
+    Log records are pushed onto an in-process queue and written to the console
+    by a background listener thread, so request handlers never block on I/O.
+    Safe to call more than once: does nothing if the root logger is already configured.
+    """
+    root_logger = logging.getLogger()
+    if root_logger.handlers:
+        return
+
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(logging.Formatter(_FORMAT))
+
+    root_logger.setLevel(_LEVEL)
+    root_logger.addHandler(queue_handler)
+
+    # Access messages go straight to the queue without walking up to the root logger
+    access_logger.addHandler(queue_handler)
+    access_logger.propagate = False
+
+    listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
@@ -2,18 +2,25 @@
 
 import asyncio
 import logging
+import sys
+import orjson
 import uvicorn
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.config import get_settings
 from app.logging import setup_logging
 from app.routes import auth_router, management_router
-from app.services.database import SessionLocal, init_db
+from app.services.access_log import access_log_buffer
+from app.services.database import BackgroundSession, init_db
 from app.services.session_service import SessionService
+from app.services.token_cache import TokenSnapshot, token_cache
+from app.services.token_service import TokenService
+from app.utils.responses import ORJSONResponse
+from app.utils.ticker import Job, ticker
 
 # Setup logging first
 setup_logging()
@@ -21,27 +28,61 @@ logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
-async def cleanup_expired_sessions_task() -> None:
-    """Background task to periodically clean up expired sessions."""
-    while True:
-        try:
-            await asyncio.sleep(settings.session_cleanup_interval)
-
-            db = SessionLocal()
-            try:
-                count = SessionService.cleanup_expired_sessions(db)
-                if count > 0:
-                    logger.info(f"Cleaned up {count} expired sessions")
-            except SQLAlchemyError as e:
-                logger.error(f"Database error during session cleanup: {e}", exc_info=True)
-            finally:
-                db.close()
-
-        except asyncio.CancelledError:
-            logger.info("Session cleanup task cancelled")
-            raise
-        except Exception as e:
-            logger.error(f"Unexpected error in cleanup task: {e}", exc_info=True)
+def cleanup_expired_sessions() -> None:
+    """Delete expired sessions from the database."""
+    db = BackgroundSession()
+    try:
+        count = SessionService.cleanup_expired_sessions(db)
+        if count > 0:
+            logger.info("Cleaned up %s expired sessions", count)
+    except SQLAlchemyError as e:
+        logger.error("Database error during session cleanup: %s", e, exc_info=True)
+    finally:
+        BackgroundSession.remove()
+
+
+def expire_tokens() -> None:
+    """Mark tokens past their validity period as expired."""
+    db = BackgroundSession()
+    try:
+        count = TokenService.expire_tokens(db)
+        if count > 0:
+            logger.info("Marked %s tokens as expired", count)
+    except SQLAlchemyError as e:
+        logger.error("Database error during token expiry: %s", e, exc_info=True)
+    finally:
+        BackgroundSession.remove()
+
+
+def load_token_snapshots(tokens: list[str]) -> tuple[list[TokenSnapshot], list[str]] | None:
+    """Load fresh snapshots for cached tokens (runs in a worker thread); None on database error."""
+    db = BackgroundSession()
+    try:
+        return TokenService.load_snapshots(db, tokens)
+    except SQLAlchemyError as e:
+        logger.error("Database error during token cache refresh: %s", e, exc_info=True)
+        return None
+    finally:
+        BackgroundSession.remove()
+
+
+async def refresh_token_cache() -> None:
+    """Reload tokens that are being used from the database before their cache entries expire."""
+    # The cache is only touched on the event loop thread; just the SELECTs run in a worker thread
+    tokens = token_cache.take_recent()
+    if not tokens:
+        return
+    loaded = await asyncio.to_thread(load_token_snapshots, tokens)
+    if loaded is not None:
+        token_cache.refresh(*loaded)
+
+
+def flush_access_logs() -> None:
+    """Write all buffered access logs to the database."""
+    try:
+        access_log_buffer.flush()
+    except SQLAlchemyError as e:
+        logger.error("Database error during access log flush: %s", e, exc_info=True)
 
 
 @asynccontextmanager
@@ -52,20 +93,31 @@ async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
     init_db()
     logger.info(f"Server starting on {settings.api_host}:{settings.api_port}")
 
-    # Start background cleanup task
-    cleanup_task = asyncio.create_task(cleanup_expired_sessions_task())
-    logger.info("Background cleanup task started")
+    # Start periodic background jobs (session cleanup, token expiry, access log writer, token cache refresh)
+    jobs: list[tuple[int, Job]] = [
+        (settings.session_cleanup_interval, cleanup_expired_sessions),
+        (settings.session_cleanup_interval, expire_tokens),
+        (settings.access_log_flush_interval, flush_access_logs),
+    ]
+    if token_cache.enabled:
+        # Refresh at half the TTL so tokens in use are reloaded in one batch before they expire
+        jobs.append((max(1, settings.token_cache_ttl // 2), refresh_token_cache))
+    ticker_task = asyncio.create_task(ticker(jobs))
+    logger.info("Background tasks started")
 
     yield
 
     # Shutdown
     logger.info("Shutting down Flussonic Auth Backend...")
-    cleanup_task.cancel()
+    ticker_task.cancel()
     try:
-        await cleanup_task
+        await ticker_task
     except asyncio.CancelledError:
         pass
-    logger.info("Cleanup task stopped")
+    logger.info("Background tasks stopped")
+
+    # Write any access logs still buffered
+    flush_access_logs()
 
 
 # Create FastAPI app
@@ -74,6 +126,7 @@ app = FastAPI(
     description="Authentication backend for Flussonic Media Server with token and session management",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
 )
@@ -83,10 +136,9 @@ app.include_router(auth_router)
 app.include_router(management_router)
 
 
-@app.get("/", tags=["info"])
-async def root() -> dict[str, str | dict[str, str]]:
-    """Root endpoint with API information."""
-    return {
+# Static response bodies, serialized once at import
+_ROOT_BODY = orjson.dumps(
+    {
         "service": "Flussonic Auth Backend",
         "version": "1.0.0",
         "status": "healthy",
@@ -98,12 +150,20 @@ async def root() -> dict[str, str | dict[str, str]]:
             "management": "/api",
         },
     }
+)
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
+@app.get("/", tags=["info"])
+async def root() -> Response:
+    """Root endpoint with API information."""
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 @app.get("/health", tags=["health"])
-async def health_check() -> dict[str, str]:
+async def health_check() -> Response:
     """Health check endpoint for Docker."""
-    return {"status": "healthy"}
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 def main() -> None:
@@ -113,6 +173,12 @@ def main() -> None:
         host=settings.api_host,
         port=settings.api_port,
         reload=False,
+        workers=settings.api_workers,
+        # C event loop and HTTP parser (both installed with uvicorn[standard]; uvloop is unavailable on Windows)
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        # Auth requests are already logged by the app; skip Uvicorn's per-request access lines
+        access_log=False,
         log_level=settings.log_level.lower(),
     )
 
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
 
@@ -13,11 +13,15 @@ class ActiveSession(Base):
     """Active sessions table - tracks currently active streaming sessions."""
 
     __tablename__ = "active_sessions"
+    __table_args__ = (
+        # Serves the per-user active-session lookups (user_id = ? AND expires_at ...) on every new session
+        Index("ix_active_sessions_user_expires", "user_id", "expires_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     session_id: Mapped[str] = mapped_column(String(255), unique=True, nullable=False, index=True)
     token_id: Mapped[int] = mapped_column(Integer, ForeignKey("tokens.id", ondelete="CASCADE"), nullable=False)
-    user_id: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    user_id: Mapped[str] = mapped_column(String(100), nullable=False)
     stream_name: Mapped[str] = mapped_column(String(255), nullable=False)
     client_ip: Mapped[str] = mapped_column(String(45), nullable=False)
     protocol: Mapped[str] = mapped_column(String(20), nullable=False)
@@ -27,8 +31,7 @@ class ActiveSession(Base):
 
     def __repr__(self) -> str:
         """String representation of ActiveSession."""
-        session_preview = self.session_id[:10] if len(self.session_id) >= 10 else self.session_id
         return (
-            f"<ActiveSession(id={self.id}, session_id={session_preview}..., "
+            f"<ActiveSession(id={self.id}, session_id={self.session_id[:10]}..., "
             f"user_id={self.user_id}, stream={self.stream_name})>"
         )
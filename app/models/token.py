@@ -2,9 +2,11 @@
 
 import json
 import logging
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
+import orjson
 from sqlalchemy import DateTime, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -14,6 +16,14 @@ from app.services.database import Base
 logger = logging.getLogger(__name__)
 
 
+def _dumps(value: Any) -> str:
+    """Serialize a JSON column value, falling back to json for what orjson rejects (e.g. integers over 64 bits)."""
+    try:
+        return orjson.dumps(value).decode()
+    except TypeError:
+        return json.dumps(value, separators=(",", ":"))
+
+
 class Token(Base):
     """Token table - stores authentication tokens with their configuration."""
 
@@ -32,13 +42,24 @@ class Token(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime, default=func.now(), onupdate=func.now())
 
+    def _parse_json(self, field: str, raw: str, loads: Callable[[str], Any] = orjson.loads) -> Any:
+        """Parse a JSON column value, reusing the last result while the raw value is unchanged."""
+        cache: dict[str, tuple[str, Any]] = self.__dict__.setdefault("_json_cache", {})
+        cached = cache.get(field)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+
+        parsed = loads(raw)
+        cache[field] = (raw, parsed)
+        return parsed
+
     def get_allowed_ips(self) -> list[str] | None:
         """Parse allowed_ips JSON field."""
         if not self.allowed_ips:
             return None
         try:
-            return json.loads(self.allowed_ips)
-        except json.JSONDecodeError as e:
+            return self._parse_json("allowed_ips", self.allowed_ips)
+        except orjson.JSONDecodeError as e:
             logger.warning(f"Failed to parse allowed_ips for token {self.id}: {e}")
             return None
 
@@ -47,34 +68,56 @@ class Token(Base):
         if not self.allowed_streams:
             return None
         try:
-            return json.loads(self.allowed_streams)
-        except json.JSONDecodeError as e:
+            return self._parse_json("allowed_streams", self.allowed_streams)
+        except orjson.JSONDecodeError as e:
             logger.warning(f"Failed to parse allowed_streams for token {self.id}: {e}")
             return None
 
+    def get_allowed_ip_set(self) -> frozenset[str] | None:
+        """Allowed IPs as a frozenset for O(1) membership checks."""
+        return self._as_set("allowed_ips", self.allowed_ips, self.get_allowed_ips())
+
+    def get_allowed_stream_set(self) -> frozenset[str] | None:
+        """Allowed streams as a frozenset for O(1) membership checks."""
+        return self._as_set("allowed_streams", self.allowed_streams, self.get_allowed_streams())
+
+    def _as_set(self, field: str, raw: str | None, values: list[str] | None) -> frozenset[str] | None:
+        """Build a frozenset from a parsed list column, memoized like _parse_json."""
+        if not values:
+            return None
+        cache: dict[str, tuple[str | None, Any]] = self.__dict__.setdefault("_json_cache", {})
+        key = f"{field}_set"
+        cached = cache.get(key)
+        if cached is not None and cached[0] is raw:
+            return cached[1]
+
+        result = frozenset(values)
+        cache[key] = (raw, result)
+        return result
+
     def get_meta(self) -> dict[str, Any]:
         """Parse metadata JSON field."""
         if not self.meta:
             return {}
         try:
-            return json.loads(self.meta)
+            # json, not orjson: meta is free-form and orjson reads integers over 64 bits as floats
+            return self._parse_json("meta", self.meta, json.loads)
         except json.JSONDecodeError as e:
             logger.warning(f"Failed to parse meta for token {self.id}: {e}")
             return {}
 
     def set_allowed_ips(self, ips: list[str]) -> None:
         """Set allowed_ips as JSON."""
-        self.allowed_ips = json.dumps(ips)
+        self.allowed_ips = _dumps(ips)
 
     def set_allowed_streams(self, streams: list[str]) -> None:
         """Set allowed_streams as JSON."""
-        self.allowed_streams = json.dumps(streams)
+        self.allowed_streams = _dumps(streams)
 
     def set_meta(self, data: dict[str, Any]) -> None:
         """Set metadata as JSON."""
-        self.meta = json.dumps(data)
+        self.meta = _dumps(data)
 
     def __repr__(self) -> str:
         """String representation of Token."""
-        token_preview = self.token[:10] if len(self.token) >= 10 else self.token
-        return f"<Token(id={self.id}, token={token_preview}..., user_id={self.user_id}, status={self.status})>"
+        return f"<Token(id={self.id}, token={self.token[:10]}..., user_id={self.user_id}, status={self.status})>"
@@ -1,23 +1,33 @@
 """All API routes consolidated in one file."""
 
+import hmac
 import logging
-from typing import Annotated
+from collections.abc import Callable
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+import orjson
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.config import get_settings
-from app.services.database import get_db
+from app.logging import access_logger
+from app.services.database import LazySession, get_db
+from app.models.session import ActiveSession
 from app.models.token import Token
 from app.schemas.auth import DeniedResponse
 from app.schemas.management import SessionResponse, TokenCreate, TokenResponse, TokenUpdate
 from app.services.session_service import SessionService
 from app.services.token_service import TokenService
 from app.services.validation import ValidationService
+from app.utils.responses import ORJSONResponse
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+# Settings read on every request, bound once at import
+_AUTH_DURATION = str(settings.auth_duration)
+_API_KEY = settings.api_key.encode() if settings.api_key else None
+
 # Create routers
 auth_router = APIRouter(tags=["auth"])
 management_router = APIRouter(prefix="/api", tags=["management"])
@@ -28,14 +38,13 @@ management_router = APIRouter(prefix="/api", tags=["management"])
 # ============================================================================
 
 
-@auth_router.get("/auth")
-@auth_router.post("/auth")
+@auth_router.get("/auth", responses={403: {"model": DeniedResponse}})
+@auth_router.post("/auth", responses={403: {"model": DeniedResponse}})
 async def authorize(
     name: Annotated[str, Query(description="Stream name")],
     ip: Annotated[str, Query(description="Client IP address")],
     token: Annotated[str, Query(description="Authorization token")],
     proto: Annotated[str, Query(description="Protocol (hls, rtmp, rtsp, etc.)")] = "unknown",
-    db: Session = Depends(get_db),
 ) -> Response:
     """
     Main authorization endpoint called by Flussonic Media Server.
@@ -43,50 +52,47 @@ async def authorize(
     Returns HTTP 200 with headers X-UserId, X-Max-Sessions, X-AuthDuration if authorized.
     Returns HTTP 403 with JSON error details if denied.
     """
-    logger.info(f"Auth request: stream={name}, ip={ip}, token={token[:10]}..., proto={proto}")
-
-    # Validate authorization
-    is_allowed, denial_reason, token_obj = ValidationService.validate_authorization(
-        db=db,
-        stream_name=name,
-        client_ip=ip,
-        token=token,
-        protocol=proto,
-    )
+    if access_logger.isEnabledFor(logging.INFO):
+        access_logger.info("Auth request: stream=%s, ip=%s, token=%s..., proto=%s", name, ip, token[:10], proto)
+
+    # Validate authorization; the session is opened only if the token cache can't answer alone
+    with LazySession() as db:
+        is_allowed, denial_reason, token_obj = ValidationService.validate_authorization(
+            db=db,
+            stream_name=name,
+            client_ip=ip,
+            token=token,
+            protocol=proto,
+        )
 
     if is_allowed and token_obj:
         # Access granted - return 200 with headers
-        logger.info(f"Access GRANTED: user_id={token_obj.user_id}, stream={name}")
+        access_logger.info("Access GRANTED: user_id=%s, stream=%s", token_obj.user_id, name)
 
         response = Response(status_code=status.HTTP_200_OK)
         response.headers["X-UserId"] = token_obj.user_id
         response.headers["X-Max-Sessions"] = str(token_obj.max_sessions)
-        response.headers["X-AuthDuration"] = str(settings.auth_duration)
+        response.headers["X-AuthDuration"] = _AUTH_DURATION
 
         return response
 
     # Access denied - return 403 with JSON error
-    logger.warning(f"Access DENIED: reason={denial_reason}, stream={name}, ip={ip}")
-
-    error_messages = {
-        "token_not_found": "Invalid or unknown token",
-        "token_suspended": "Token has been suspended",
-        "token_expired": "Token has expired",
-        "token_not_yet_valid": "Token is not yet valid",
-        "max_sessions_reached": f"Maximum concurrent sessions limit reached ({token_obj.max_sessions if token_obj else 'N/A'})",
-        "ip_not_allowed": f"IP address {ip} is not authorized for this token",
-        "stream_not_allowed": f"Stream '{name}' is not authorized for this token",
-    }
-
-    error_response = DeniedResponse(
-        error="access_denied",
-        reason=denial_reason or "unknown",
-        message=error_messages.get(denial_reason or "", "Access denied"),
-        user_id=token_obj.user_id if token_obj else None,
+    access_logger.warning("Access DENIED: reason=%s, stream=%s, ip=%s", denial_reason, name, ip)
+
+    message = _denial_message(denial_reason, ip, name, token_obj.max_sessions if token_obj else "N/A")
+
+    # Same shape as DeniedResponse, serialized directly
+    content = orjson.dumps(
+        {
+            "error": "access_denied",
+            "reason": denial_reason or "unknown",
+            "message": message,
+            "user_id": token_obj.user_id if token_obj else None,
+        }
     )
 
     return Response(
-        content=error_response.model_dump_json(),
+        content=content,
         status_code=status.HTTP_403_FORBIDDEN,
         media_type="application/json",
     )
@@ -97,25 +103,40 @@ async def authorize(
 # ============================================================================
 
 
-def verify_api_key(x_api_key: str | None = Header(None)) -> str | None:
-    """Verify API key if configured."""
-    if settings.api_key and x_api_key != settings.api_key:
-        logger.warning(f"Invalid API key attempt: {x_api_key}")
-        raise HTTPException(status_code=401, detail="Invalid or missing API key")
-    return x_api_key
+def _api_key_checker(api_key: bytes) -> Callable[..., str | None]:
+    """Build the dependency that verifies the X-API-Key header against the configured API key."""
+
+    def _verify_api_key(request: Request, x_api_key: str | None = Header(None)) -> str | None:
+        """Verify the X-API-Key header against the configured API key."""
+        if not hmac.compare_digest((x_api_key or "").encode(), api_key):
+            logger.warning("Invalid API key attempt from %s", request.client.host if request.client else "unknown")
+            raise HTTPException(status_code=401, detail="Invalid or missing API key")
+        return x_api_key
+
+    return _verify_api_key
+
+
+def _skip_api_key() -> None:
+    """No API key configured - management endpoints are open."""
+    return None
 
 
-@management_router.post("/tokens", response_model=TokenResponse, status_code=status.HTTP_201_CREATED)
+verify_api_key: Callable[..., str | None] = _api_key_checker(_API_KEY) if _API_KEY else _skip_api_key
+
+
+@management_router.post(
+    "/tokens", status_code=status.HTTP_201_CREATED, responses={status.HTTP_201_CREATED: {"model": TokenResponse}}
+)
 async def create_token(
     token_data: TokenCreate,
     db: Session = Depends(get_db),
     _: str | None = Depends(verify_api_key),
-) -> TokenResponse:
+) -> ORJSONResponse:
     """Create a new authentication token."""
     # Check if token already exists
     existing = TokenService.get_by_token(db, token_data.token)
     if existing:
-        logger.warning(f"Attempt to create duplicate token: {token_data.token}")
+        logger.warning("Attempt to create duplicate token: %s", token_data.token)
         raise HTTPException(status_code=400, detail="Token already exists")
 
     db_token = TokenService.create_token(
@@ -131,43 +152,44 @@ async def create_token(
         meta=token_data.meta,
     )
 
-    logger.info(f"Token created: {db_token.token} for user {db_token.user_id}")
-    return _token_to_response(db_token)
+    logger.info("Token created: %s for user %s", db_token.token, db_token.user_id)
+    return ORJSONResponse(_token_to_response(db_token), status_code=status.HTTP_201_CREATED)
 
 
-@management_router.get("/tokens", response_model=list[TokenResponse])
+@management_router.get("/tokens", responses={200: {"model": list[TokenResponse]}})
 async def list_tokens(
     status_filter: Annotated[str | None, Query(alias="status", description="Filter by status")] = None,
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000)] = 100,
     db: Session = Depends(get_db),
     _: str | None = Depends(verify_api_key),
-) -> list[TokenResponse]:
+) -> ORJSONResponse:
     """List all tokens with optional filtering."""
     tokens = TokenService.list_tokens(db, status=status_filter, skip=skip, limit=limit)
-    return [_token_to_response(t) for t in tokens]
+    # Returned directly: skips per-row response model validation
+    return ORJSONResponse([_token_to_response(t) for t in tokens])
 
 
-@management_router.get("/tokens/{token_id}", response_model=TokenResponse)
+@management_router.get("/tokens/{token_id}", responses={200: {"model": TokenResponse}})
 async def get_token(
     token_id: int,
     db: Session = Depends(get_db),
     _: str | None = Depends(verify_api_key),
-) -> TokenResponse:
+) -> ORJSONResponse:
     """Get a specific token by ID."""
     db_token = TokenService.get_by_id(db, token_id)
     if not db_token:
         raise HTTPException(status_code=404, detail="Token not found")
-    return _token_to_response(db_token)
+    return ORJSONResponse(_token_to_response(db_token))
 
 
-@management_router.patch("/tokens/{token_id}", response_model=TokenResponse)
+@management_router.patch("/tokens/{token_id}", responses={200: {"model": TokenResponse}})
 async def update_token(
     token_id: int,
     token_update: TokenUpdate,
     db: Session = Depends(get_db),
     _: str | None = Depends(verify_api_key),
-) -> TokenResponse:
+) -> ORJSONResponse:
     """Update a token's settings."""
     db_token = TokenService.update_token(
         db=db,
@@ -183,8 +205,8 @@ async def update_token(
     if not db_token:
         raise HTTPException(status_code=404, detail="Token not found")
 
-    logger.info(f"Token updated: {db_token.token}")
-    return _token_to_response(db_token)
+    logger.info("Token updated: %s", db_token.token)
+    return ORJSONResponse(_token_to_response(db_token))
 
 
 @management_router.delete("/tokens/{token_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -197,7 +219,7 @@ async def delete_token(
     success = TokenService.delete_token(db, token_id)
     if not success:
         raise HTTPException(status_code=404, detail="Token not found")
-    logger.info(f"Token deleted: ID {token_id}")
+    logger.info("Token deleted: ID %s", token_id)
 
 
 # ============================================================================
@@ -205,28 +227,28 @@ async def delete_token(
 # ============================================================================
 
 
-@management_router.get("/sessions", response_model=list[SessionResponse])
+@management_router.get("/sessions", responses={200: {"model": list[SessionResponse]}})
 async def list_sessions(
     user_id: Annotated[str | None, Query(description="Filter by user ID")] = None,
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=1000)] = 100,
     db: Session = Depends(get_db),
     _: str | None = Depends(verify_api_key),
-) -> list:  # noqa: ANN202
+) -> ORJSONResponse:
     """List active sessions with optional user filtering."""
     sessions = SessionService.list_sessions(db, user_id=user_id, skip=skip, limit=limit)
-    return sessions
+    return ORJSONResponse([_session_to_response(s) for s in sessions])
 
 
-@management_router.get("/sessions/user/{user_id}", response_model=list[SessionResponse])
+@management_router.get("/sessions/user/{user_id}", responses={200: {"model": list[SessionResponse]}})
 async def get_user_sessions(
     user_id: str,
     db: Session = Depends(get_db),
     _: str | None = Depends(verify_api_key),
-) -> list:  # noqa: ANN202
+) -> ORJSONResponse:
     """Get all active sessions for a specific user."""
     sessions = SessionService.get_active_sessions_by_user(db, user_id)
-    return sessions
+    return ORJSONResponse([_session_to_response(s) for s in sessions])
 
 
 @management_router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -239,7 +261,7 @@ async def terminate_session(
     success = SessionService.delete_session(db, session_id)
     if not success:
         raise HTTPException(status_code=404, detail="Session not found")
-    logger.info(f"Session terminated: {session_id}")
+    logger.info("Session terminated: %s", session_id)
 
 
 @management_router.post("/sessions/cleanup", status_code=status.HTTP_200_OK)
@@ -249,7 +271,7 @@ async def cleanup_sessions(
 ) -> dict[str, int]:
     """Manually trigger cleanup of expired sessions."""
     count = SessionService.cleanup_expired_sessions(db)
-    logger.info(f"Cleaned up {count} expired sessions")
+    logger.info("Cleaned up %s expired sessions", count)
     return {"cleaned": count}
 
 
@@ -258,19 +280,60 @@ async def cleanup_sessions(
 # ============================================================================
 
 
-def _token_to_response(token: Token) -> TokenResponse:
-    """Convert Token model to TokenResponse with parsed JSON fields."""
-    return TokenResponse(
-        id=token.id,
-        token=token.token,
-        user_id=token.user_id,
-        status=token.status,
-        max_sessions=token.max_sessions,
-        valid_from=token.valid_from,
-        valid_until=token.valid_until,
-        allowed_ips=token.get_allowed_ips(),
-        allowed_streams=token.get_allowed_streams(),
-        meta=token.get_meta(),
-        created_at=token.created_at,
-        updated_at=token.updated_at,
-    )
+def _denial_message(reason: str | None, ip: str, name: str, max_sessions: int | str) -> str:
+    """Human-readable message for an authorization denial reason."""
+    match reason:
+        case "token_not_found":
+            return "Invalid or unknown token"
+        case "token_suspended":
+            return "Token has been suspended"
+        case "token_expired":
+            return "Token has expired"
+        case "token_not_yet_valid":
+            return "Token is not yet valid"
+        case "max_sessions_reached":
+            return f"Maximum concurrent sessions limit reached ({max_sessions})"
+        case "ip_not_allowed":
+            return f"IP address {ip} is not authorized for this token"
+        case "stream_not_allowed":
+            return f"Stream '{name}' is not authorized for this token"
+        case _:
+            return "Access denied"
+
+
+def _token_to_response(token: Token) -> dict[str, Any]:
+    """
+    Convert Token model to a TokenResponse-shaped dict with parsed JSON fields.
+
+    Rows come from our own database, so they are not re-validated against the schema.
+    """
+    return {
+        "id": token.id,
+        "token": token.token,
+        "user_id": token.user_id,
+        "status": token.status,
+        "max_sessions": token.max_sessions,
+        "valid_from": token.valid_from,
+        "valid_until": token.valid_until,
+        "allowed_ips": token.get_allowed_ips(),
+        "allowed_streams": token.get_allowed_streams(),
+        "meta": token.get_meta(),
+        "created_at": token.created_at,
+        "updated_at": token.updated_at,
+    }
+
+
+def _session_to_response(session: ActiveSession) -> dict[str, Any]:
+    """Convert ActiveSession model to a SessionResponse-shaped dict."""
+    return {
+        "id": session.id,
+        "session_id": session.session_id,
+        "token_id": session.token_id,
+        "user_id": session.user_id,
+        "stream_name": session.stream_name,
+        "client_ip": session.client_ip,
+        "protocol": session.protocol,
+        "started_at": session.started_at,
+        "last_checked_at": session.last_checked_at,
+        "expires_at": session.expires_at,
+    }
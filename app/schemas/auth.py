@@ -1,6 +1,6 @@
 """Pydantic schemas for auth endpoint."""
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class AuthRequest(BaseModel):
@@ -23,6 +23,8 @@ class AuthResponse(BaseModel):
 class DeniedResponse(BaseModel):
     """Access denied response (HTTP 403)."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False, str_strip_whitespace=False)
+
     error: str = Field("access_denied", description="Error type")
     reason: str = Field(
         ...,
@@ -0,0 +1,83 @@
+"""In-memory buffer for batching access log writes."""
+
+import logging
+import threading
+from collections import deque
+from typing import Any, cast
+
+from sqlalchemy import Table
+
+from app.config import get_settings
+from app.models.log import AccessLog
+from app.services.database import engine
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Rows per INSERT/COMMIT, so a large backlog doesn't hold the database write lock in one transaction
+BATCH_SIZE = 500
+
+# Core table insert, executed with a list of dicts (executemany): no ORM objects or Session involved
+_INSERT_ACCESS_LOG = cast(Table, AccessLog.__table__).insert()
+
+
+class AccessLogBuffer:
+    """
+    Collects access log rows in memory and writes them to the database in bulk.
+
+    Rows are appended on the event loop thread and flushed from a worker thread,
+    so the buffer and drop counter are only touched under a lock.
+    """
+
+    def __init__(self, maxlen: int = 10_000) -> None:
+        self._maxlen = maxlen
+        self._rows: deque[dict[str, Any]] = deque(maxlen=maxlen)
+        self._dropped = 0
+        self._lock = threading.Lock()
+
+    def append(self, row: dict[str, Any]) -> None:
+        """Queue an access log row for the next flush (oldest rows are dropped when full)."""
+        with self._lock:
+            if len(self._rows) == self._maxlen:
+                self._dropped += 1
+            self._rows.append(row)
+
+    def flush(self) -> int:
+        """Write all buffered rows with executemany INSERTs of up to BATCH_SIZE rows and return the count written."""
+        with self._lock:
+            rows = list(self._rows)
+            self._rows.clear()
+            dropped, self._dropped = self._dropped, 0
+
+        if dropped:
+            logger.warning(
+                "Access log buffer full, dropped %s entries; consider raising ACCESS_LOG_BUFFER_SIZE", dropped
+            )
+
+        if not rows:
+            return 0
+
+        for start in range(0, len(rows), BATCH_SIZE):
+            try:
+                with engine.begin() as conn:
+                    conn.execute(_INSERT_ACCESS_LOG, rows[start : start + BATCH_SIZE])
+            except Exception:
+                self._requeue(rows[start:])
+                raise
+
+        return len(rows)
+
+    def _requeue(self, rows: list[dict[str, Any]]) -> None:
+        """Put unwritten rows back at the front of the buffer for the next flush."""
+        with self._lock:
+            space = self._maxlen - len(self._rows)
+            if len(rows) > space:
+                # Same policy as append(): the oldest rows are the ones dropped
+                overflow = len(rows) - space
+                self._dropped += overflow
+                rows = rows[overflow:]
+            self._rows.extendleft(reversed(rows))
+        logger.warning("Access log flush failed, %s rows kept for retry", len(rows))
+
+
+access_log_buffer = AccessLogBuffer(settings.access_log_buffer_size)
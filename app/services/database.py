@@ -3,14 +3,25 @@
 import logging
 from collections.abc import Generator
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy import create_engine, event, make_url
+from sqlalchemy.orm import DeclarativeBase, Session, scoped_session, sessionmaker
 
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
+_URL = make_url(settings.database_url)
+_IS_SQLITE = _URL.get_backend_name() == "sqlite"
+
+# Connection pool sizing; in-memory SQLite ("sqlite://" or ":memory:") uses a single-connection pool
+# that takes no size options
+_POOL_ARGS = (
+    {}
+    if _IS_SQLITE and _URL.database in (None, "", ":memory:")
+    else {"pool_size": 20, "max_overflow": 40, "pool_recycle": 1800}
+)
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
@@ -19,13 +30,60 @@ class Base(DeclarativeBase):
 # Create SQLAlchemy engine
 engine = create_engine(
     settings.database_url,
-    connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
+    connect_args={"check_same_thread": False} if _IS_SQLITE else {},
     echo=settings.log_level == "DEBUG",
     pool_pre_ping=True,
+    **_POOL_ARGS,
 )
 
+if _IS_SQLITE:
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record) -> None:  # noqa: ANN001
+        """Use WAL journaling so frequent small writes don't fsync on every commit."""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
+
+
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: objects stay loaded after commit instead of re-SELECTing on next access;
+# services set every value they return themselves, so nothing relies on a post-commit reload
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Thread-local sessions for background jobs (cleanup, access log writer); call BackgroundSession.remove() when done
+BackgroundSession = scoped_session(SessionLocal)
+
+
+class LazySession:
+    """
+    Context manager that opens a database session only on first use.
+
+    Lets the authorization path answer from the token cache without creating
+    a Session; the session, if one was opened, is closed on exit.
+    """
+
+    __slots__ = ("_db",)
+
+    def __init__(self) -> None:
+        self._db: Session | None = None
+
+    def get(self) -> Session:
+        """Return the session, opening it on the first call."""
+        if self._db is None:
+            self._db = SessionLocal()
+        return self._db
+
+    def __enter__(self) -> "LazySession":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._db is not None:
+            self._db.close()
+            self._db = None
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -46,4 +104,9 @@ def init_db() -> None:
 
     logger.info("Creating database tables...")
     Base.metadata.create_all(bind=engine)
+
+    # create_all skips existing tables, so add any indexes introduced after a table was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
     logger.info("Database tables created successfully")
@@ -1,10 +1,15 @@
 """Session service for managing active streaming sessions."""
 from datetime import datetime, timedelta
+from typing import Any, cast
 
+from sqlalchemy import CursorResult, bindparam, delete, select, update
 from sqlalchemy.orm import Session
 
 from app.models.session import ActiveSession
 
+# Statement for the hot session lookup, built once and reused (SQLAlchemy caches its compiled form)
+_GET_BY_SESSION_ID = select(ActiveSession).where(ActiveSession.session_id == bindparam("sid"))
+
 
 class SessionService:
     """Service for session-related database operations"""
@@ -12,7 +17,7 @@ class SessionService:
     @staticmethod
     def get_by_session_id(db: Session, session_id: str) -> ActiveSession | None:
         """Get session by session ID."""
-        return db.query(ActiveSession).filter(ActiveSession.session_id == session_id).first()
+        return db.execute(_GET_BY_SESSION_ID, {"sid": session_id}).scalar_one_or_none()
 
     @staticmethod
     def get_active_sessions_by_user(db: Session, user_id: str) -> list[ActiveSession]:
@@ -28,10 +33,12 @@ class SessionService:
         )
 
     @staticmethod
-    def count_active_sessions_by_user(db: Session, user_id: str, exclude_session_id: str | None = None) -> int:
-        """Count active sessions for a user, optionally excluding a specific session"""
-        now = datetime.now()
-        query = db.query(ActiveSession).filter(
+    def has_reached_session_limit(
+        db: Session, user_id: str, limit: int, exclude_session_id: str | None = None, now: datetime | None = None
+    ) -> bool:
+        """Check whether a user has at least `limit` active sessions, reading no more than `limit` rows"""
+        now = now or datetime.now()
+        query = db.query(ActiveSession.id).filter(
             ActiveSession.user_id == user_id,
             (ActiveSession.expires_at.is_(None)) | (ActiveSession.expires_at > now),
         )
@@ -39,7 +46,7 @@ class SessionService:
         if exclude_session_id:
             query = query.filter(ActiveSession.session_id != exclude_session_id)
 
-        return query.count()
+        return len(query.limit(limit).all()) >= limit
 
     @staticmethod
     def create_session(
@@ -51,9 +58,10 @@ class SessionService:
         client_ip: str,
         protocol: str,
         auth_duration: int = 180,
+        now: datetime | None = None,
     ) -> ActiveSession:
         """Create a new active session"""
-        now = datetime.now()
+        now = now or datetime.now()
         expires_at = now + timedelta(seconds=auth_duration)
 
         db_session = ActiveSession(
@@ -70,23 +78,23 @@ class SessionService:
 
         db.add(db_session)
         db.commit()
-        db.refresh(db_session)
         return db_session
 
     @staticmethod
-    def update_session_last_check(db: Session, session_id: str, auth_duration: int = 180) -> ActiveSession | None:
-        """Update session's last checked timestamp and extend expiration"""
-        db_session = SessionService.get_by_session_id(db, session_id)
-        if not db_session:
-            return None
-
-        now = datetime.now()
-        db_session.last_checked_at = now
-        db_session.expires_at = now + timedelta(seconds=auth_duration)
-
+    def touch_session(db: Session, session_id: str, auth_duration: int = 180, now: datetime | None = None) -> bool:
+        """Extend an existing session in a single UPDATE; returns False if the session doesn't exist"""
+        now = now or datetime.now()
+        result = cast(
+            CursorResult[Any],
+            db.execute(
+                update(ActiveSession)
+                .where(ActiveSession.session_id == session_id)
+                .values(last_checked_at=now, expires_at=now + timedelta(seconds=auth_duration))
+                .execution_options(synchronize_session=False)
+            ),
+        )
         db.commit()
-        db.refresh(db_session)
-        return db_session
+        return result.rowcount > 0
 
     @staticmethod
     def delete_session(db: Session, session_id: str) -> bool:
@@ -103,16 +111,20 @@ class SessionService:
     def cleanup_expired_sessions(db: Session) -> int:
         """Delete all expired sessions and return count deleted"""
         now = datetime.now()
-        expired = db.query(ActiveSession).filter(
-            ActiveSession.expires_at.isnot(None),
-            ActiveSession.expires_at < now,
+        result = cast(
+            CursorResult[Any],
+            db.execute(
+                delete(ActiveSession)
+                .where(
+                    ActiveSession.expires_at.isnot(None),
+                    ActiveSession.expires_at < now,
+                )
+                .execution_options(synchronize_session=False)
+            ),
         )
-
-        count = expired.count()
-        expired.delete(synchronize_session=False)
         db.commit()
 
-        return count
+        return result.rowcount
 
     @staticmethod
     def list_sessions(
@@ -0,0 +1,116 @@
+"""In-process cache of token data used by the authorization hot path."""
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.config import get_settings
+from app.models.token import Token
+
+settings = get_settings()
+
+
+@dataclass(frozen=True, slots=True)
+class TokenSnapshot:
+    """Immutable copy of the token fields needed to authorize a request."""
+
+    id: int
+    token: str
+    user_id: str
+    status: str
+    max_sessions: int
+    valid_from: datetime
+    valid_until: datetime | None
+    allowed_ips: frozenset[str] | None
+    allowed_streams: frozenset[str] | None
+
+    @classmethod
+    def from_token(cls, token: Token) -> "TokenSnapshot":
+        """Build a snapshot from a Token row."""
+        return cls(
+            id=token.id,
+            token=token.token,
+            user_id=token.user_id,
+            status=token.status,
+            max_sessions=token.max_sessions,
+            valid_from=token.valid_from,
+            valid_until=token.valid_until,
+            allowed_ips=token.get_allowed_ip_set(),
+            allowed_streams=token.get_allowed_stream_set(),
+        )
+
+
+class TokenCache:
+    """
+    Size-bounded TTL cache of TokenSnapshot keyed by token string.
+
+    Not thread-safe: only use it from the event loop thread. Background refreshes
+    load rows in a worker thread and apply them here with refresh().
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 30.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, TokenSnapshot]] = {}
+        # Tokens served from the cache since the last take_recent() call
+        self._recent: set[str] = set()
+        # Tokens invalidated since the last take_recent() call; a refresh must not put them back
+        self._invalidated: set[str] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is turned on (TTL > 0)."""
+        return self._ttl > 0
+
+    def get(self, token: str) -> TokenSnapshot | None:
+        """Return the cached snapshot for a token, or None if missing or expired."""
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._entries.pop(token, None)
+            return None
+        self._recent.add(token)
+        return entry[1]
+
+    def put(self, snapshot: TokenSnapshot) -> None:
+        """Cache a snapshot, evicting the entry closest to expiry when full."""
+        if not self.enabled:
+            return
+        # Re-insert at the end, so dict order is expiry order: the first entry is always the one
+        # expiring soonest (expired ones first), never a hot token that keeps being refreshed
+        if self._entries.pop(snapshot.token, None) is None and len(self._entries) >= self._maxsize:
+            self._entries.pop(next(iter(self._entries)))
+        self._entries[snapshot.token] = (time.monotonic() + self._ttl, snapshot)
+
+    def invalidate(self, token: str) -> None:
+        """Drop a token from the cache (call after it is changed or deleted)."""
+        self._entries.pop(token, None)
+        if self.enabled:
+            self._invalidated.add(token)
+
+    def take_recent(self) -> list[str]:
+        """Return the tokens served from the cache since the last call, and start a new refresh round."""
+        recent, self._recent = self._recent, set()
+        self._invalidated = set()
+        return list(recent)
+
+    def refresh(self, snapshots: list[TokenSnapshot], missing: list[str]) -> None:
+        """
+        Apply a refresh of the tokens returned by take_recent().
+
+        Tokens invalidated while the refresh was loading are skipped, since their
+        loaded rows may predate the change; the next request reloads them.
+        """
+        for snapshot in snapshots:
+            if snapshot.token not in self._invalidated:
+                self.put(snapshot)
+        for token in missing:
+            self._entries.pop(token, None)
+
+    def clear(self) -> None:
+        """Drop all cached tokens."""
+        self._entries.clear()
+
+
+token_cache = TokenCache(ttl=settings.token_cache_ttl)
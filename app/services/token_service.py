@@ -1,9 +1,24 @@
 """Token service for database operations"""
-from datetime import datetime
+from datetime import UTC, datetime
+from typing import Any, cast
 
+from sqlalchemy import CursorResult, bindparam, select, update
 from sqlalchemy.orm import Session
 
 from app.models.token import Token
+from app.services.token_cache import TokenSnapshot, token_cache
+
+# Statements for hot lookups, built once and reused (SQLAlchemy caches their compiled form)
+_GET_BY_TOKEN = select(Token).where(Token.token == bindparam("t"))
+_GET_BY_ID = select(Token).where(Token.id == bindparam("id"))
+
+# Tokens per IN (...) query when refreshing the cache (stays under SQLite's bound parameter limit)
+_REFRESH_BATCH_SIZE = 500
+
+
+def _naive(value: datetime | None) -> datetime | None:
+    """Drop tzinfo, as the naive DateTime columns do on write, so returned objects match stored values."""
+    return value.replace(tzinfo=None) if value is not None else None
 
 
 class TokenService:
@@ -12,12 +27,47 @@ class TokenService:
     @staticmethod
     def get_by_token(db: Session, token: str) -> Token | None:
         """Get token by token string"""
-        return db.query(Token).filter(Token.token == token).first()
+        return db.execute(_GET_BY_TOKEN, {"t": token}).scalar_one_or_none()
+
+    @staticmethod
+    def get_snapshot(db: Session, token: str) -> TokenSnapshot | None:
+        """Get cached token data by token string, loading it from the database on a miss"""
+        snapshot = token_cache.get(token)
+        if snapshot is None:
+            db_token = TokenService.get_by_token(db, token)
+            if not db_token:
+                return None
+            snapshot = TokenSnapshot.from_token(db_token)
+            token_cache.put(snapshot)
+        return snapshot
+
+    @staticmethod
+    def load_snapshots(db: Session, tokens: list[str]) -> tuple[list[TokenSnapshot], list[str]]:
+        """
+        Load snapshots for the given tokens with batched IN queries.
+
+        Does not touch the cache, so it can run in a worker thread.
+
+        Returns:
+            Tuple of (snapshots found, tokens no longer in the database)
+        """
+        snapshots: list[TokenSnapshot] = []
+        missing: list[str] = []
+
+        for start in range(0, len(tokens), _REFRESH_BATCH_SIZE):
+            batch = tokens[start : start + _REFRESH_BATCH_SIZE]
+            found = db.execute(select(Token).where(Token.token.in_(batch))).scalars().all()
+
+            snapshots.extend(TokenSnapshot.from_token(db_token) for db_token in found)
+            # Tokens deleted elsewhere (e.g. by another worker)
+            missing.extend(set(batch).difference(t.token for t in found))
+
+        return snapshots, missing
 
     @staticmethod
     def get_by_id(db: Session, token_id: int) -> Token | None:
         """Get token by ID"""
-        return db.query(Token).filter(Token.id == token_id).first()
+        return db.execute(_GET_BY_ID, {"id": token_id}).scalar_one_or_none()
 
     @staticmethod
     def get_by_user_id(db: Session, user_id: str) -> list[Token]:
@@ -38,13 +88,20 @@ class TokenService:
         meta: dict | None = None,
     ) -> Token:
         """Create a new token"""
+        # Timestamps set here rather than by the database, so no reload is needed after commit.
+        # created_at/updated_at stay in UTC like the column default (CURRENT_TIMESTAMP) they replace;
+        # valid_from stays local time, as validation compares it with datetime.now()
+        now = datetime.now()
+        created = datetime.now(UTC).replace(tzinfo=None)
         db_token = Token(
             token=token,
             user_id=user_id,
             status=status,
             max_sessions=max_sessions,
-            valid_from=valid_from or datetime.now(),
-            valid_until=valid_until,
+            valid_from=_naive(valid_from) or now,
+            valid_until=_naive(valid_until),
+            created_at=created,
+            updated_at=created,
         )
 
         if allowed_ips:
@@ -56,7 +113,6 @@ class TokenService:
 
         db.add(db_token)
         db.commit()
-        db.refresh(db_token)
         return db_token
 
     @staticmethod
@@ -75,12 +131,14 @@ class TokenService:
                     db_token.set_allowed_streams(value)
                 elif key == "meta" and isinstance(value, dict):
                     db_token.set_meta(value)
+                elif isinstance(value, datetime):
+                    setattr(db_token, key, _naive(value))
                 elif hasattr(db_token, key):
                     setattr(db_token, key, value)
 
         db_token.updated_at = datetime.now()
         db.commit()
-        db.refresh(db_token)
+        token_cache.invalidate(db_token.token)
         return db_token
 
     @staticmethod
@@ -92,8 +150,30 @@ class TokenService:
 
         db.delete(db_token)
         db.commit()
+        token_cache.invalidate(db_token.token)
         return True
 
+    @staticmethod
+    def expire_tokens(db: Session) -> int:
+        """Mark active tokens past their valid_until as expired and return count updated"""
+        now = datetime.now()
+        result = cast(
+            CursorResult[Any],
+            db.execute(
+                update(Token)
+                .where(
+                    Token.status == "active",
+                    Token.valid_until.isnot(None),
+                    Token.valid_until < now,
+                )
+                .values(status="expired", updated_at=now)
+                .execution_options(synchronize_session=False)
+            ),
+        )
+        db.commit()
+
+        return result.rowcount
+
     @staticmethod
     def list_tokens(
         db: Session,
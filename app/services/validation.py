@@ -1,136 +1,142 @@
 """Validation service for authorization logic."""
 
-from datetime import datetime
-
-from sqlalchemy.orm import Session
+from datetime import UTC, datetime
 
 from app.config import get_settings
-from app.models.log import AccessLog
-from app.models.token import Token
+from app.services.access_log import access_log_buffer
+from app.services.database import LazySession
 from app.services.session_service import SessionService
+from app.services.token_cache import TokenSnapshot, token_cache
 from app.services.token_service import TokenService
 from app.utils.session_id import generate_session_id
 
 settings = get_settings()
 
+# Settings read on every request, bound once at import
+_LOG_ENABLED = settings.enable_access_logs
+_AUTH_DURATION = settings.auth_duration
+
 
 class ValidationService:
     """Service for authorization validation logic."""
 
     @staticmethod
     def validate_authorization(
-        db: Session,
+        db: LazySession,
         stream_name: str,
         client_ip: str,
         token: str,
         protocol: str = "unknown",
-    ) -> tuple[bool, str | None, Token | None]:
+    ) -> tuple[bool, str | None, TokenSnapshot | None]:
         """
         Validate authorization request from Flussonic
 
+        The database session is only opened when the token cache misses or a session must be checked or written.
+
         Returns:
             Tuple of (is_allowed, denial_reason, token_object)
         """
 
-        # 1. Look up token
-        token_obj = TokenService.get_by_token(db, token)
+        # Single timestamp for every check and write in this request
+        now = datetime.now()
+
+        # 1. Look up token (served from the in-process cache on re-checks, without opening a session)
+        token_obj = token_cache.get(token) or TokenService.get_snapshot(db.get(), token)
         if not token_obj:
-            ValidationService._log_access(db, token, None, stream_name, client_ip, protocol, "denied", "token_not_found")
+            ValidationService._log_access(
+                token, None, stream_name, client_ip, protocol, "denied", "token_not_found", now
+            )
             return False, "token_not_found", None
 
         # 2. Check token status
         if token_obj.status == "suspended":
             ValidationService._log_access(
-                db, token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "token_suspended"
+                token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "token_suspended", now
             )
             return False, "token_suspended", token_obj
 
         if token_obj.status == "expired":
             ValidationService._log_access(
-                db, token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "token_expired"
+                token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "token_expired", now
             )
             return False, "token_expired", token_obj
 
         # 3. Check validity period
-        now = datetime.now()
         if now < token_obj.valid_from:
             ValidationService._log_access(
-                db, token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "token_not_yet_valid"
+                token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "token_not_yet_valid", now
             )
             return False, "token_not_yet_valid", token_obj
 
         if token_obj.valid_until and now > token_obj.valid_until:
-            # Auto-expire the token
-            TokenService.update_token(db, token_obj.id, status="expired")
+            # Status is switched to "expired" by the periodic token sweep, not on the request path
             ValidationService._log_access(
-                db, token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "token_expired"
+                token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "token_expired", now
             )
             return False, "token_expired", token_obj
 
-        # 4. Check IP whitelist
-        allowed_ips = token_obj.get_allowed_ips()
+        # 4. Check IP whitelist (frozenset membership)
+        allowed_ips = token_obj.allowed_ips
         if allowed_ips and client_ip not in allowed_ips:
             ValidationService._log_access(
-                db, token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "ip_not_allowed"
+                token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "ip_not_allowed", now
             )
             return False, "ip_not_allowed", token_obj
 
         # 5. Check stream whitelist
-        allowed_streams = token_obj.get_allowed_streams()
+        allowed_streams = token_obj.allowed_streams
         if allowed_streams and stream_name not in allowed_streams:
             ValidationService._log_access(
-                db, token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "stream_not_allowed"
+                token, token_obj.user_id, stream_name, client_ip, protocol, "denied", "stream_not_allowed", now
             )
             return False, "stream_not_allowed", token_obj
 
         # 6. Check concurrent sessions limit
         session_id = generate_session_id(stream_name, client_ip, token)
-        existing_session = SessionService.get_by_session_id(db, session_id)
 
-        if existing_session:
-            # This is a re-check (Flussonic checks every 3 minutes)
-            SessionService.update_session_last_check(db, session_id, settings.auth_duration)
+        # Re-check of an existing session (Flussonic checks every 3 minutes): extend it in one UPDATE
+        if SessionService.touch_session(db.get(), session_id, _AUTH_DURATION, now=now):
             ValidationService._log_access(
-                db, token, token_obj.user_id, stream_name, client_ip, protocol, "allowed", "session_recheck"
+                token, token_obj.user_id, stream_name, client_ip, protocol, "allowed", "session_recheck", now
             )
             return True, None, token_obj
-        else:
-            # New session attempt - check limit
-            active_count = SessionService.count_active_sessions_by_user(db, token_obj.user_id, exclude_session_id=session_id)
-
-            if active_count >= token_obj.max_sessions:
-                ValidationService._log_access(
-                    db,
-                    token,
-                    token_obj.user_id,
-                    stream_name,
-                    client_ip,
-                    protocol,
-                    "denied",
-                    f"max_sessions_reached ({active_count}/{token_obj.max_sessions})",
-                )
-                return False, "max_sessions_reached", token_obj
-
-            # Create new session
-            SessionService.create_session(
-                db=db,
-                session_id=session_id,
-                token_id=token_obj.id,
-                user_id=token_obj.user_id,
-                stream_name=stream_name,
-                client_ip=client_ip,
-                protocol=protocol,
-                auth_duration=settings.auth_duration,
-            )
 
+        # New session attempt - check limit
+        if SessionService.has_reached_session_limit(
+            db.get(), token_obj.user_id, token_obj.max_sessions, exclude_session_id=session_id, now=now
+        ):
             ValidationService._log_access(
-                db, token, token_obj.user_id, stream_name, client_ip, protocol, "allowed", "new_session"
+                token,
+                token_obj.user_id,
+                stream_name,
+                client_ip,
+                protocol,
+                "denied",
+                f"max_sessions_reached (limit {token_obj.max_sessions})",
+                now,
             )
-            return True, None, token_obj
+            return False, "max_sessions_reached", token_obj
+
+        # Create new session
+        SessionService.create_session(
+            db=db.get(),
+            session_id=session_id,
+            token_id=token_obj.id,
+            user_id=token_obj.user_id,
+            stream_name=stream_name,
+            client_ip=client_ip,
+            protocol=protocol,
+            auth_duration=_AUTH_DURATION,
+            now=now,
+        )
+
+        ValidationService._log_access(
+            token, token_obj.user_id, stream_name, client_ip, protocol, "allowed", "new_session", now
+        )
+        return True, None, token_obj
 
     @staticmethod
     def _log_access(
-        db: Session,
         token: str,
         user_id: str | None,
         stream_name: str,
@@ -138,20 +144,22 @@ class ValidationService:
         protocol: str,
         result: str,
         reason: str,
+        now: datetime,
     ) -> None:
-        """Log access attempt to database if logging is enabled"""
-        if not settings.enable_access_logs:
+        """Queue access attempt for the batched database writer if logging is enabled"""
+        if not _LOG_ENABLED:
             return
 
-        log_entry = AccessLog(
-            token=token,
-            user_id=user_id,
-            stream_name=stream_name,
-            client_ip=client_ip,
-            protocol=protocol,
-            result=result,
-            reason=reason,
+        access_log_buffer.append(
+            {
+                # The request's local timestamp stored in UTC, as the column default (CURRENT_TIMESTAMP) did
+                "timestamp": now.astimezone(UTC).replace(tzinfo=None),
+                "token": token,
+                "user_id": user_id,
+                "stream_name": stream_name,
+                "client_ip": client_ip,
+                "protocol": protocol,
+                "result": result,
+                "reason": reason,
+            }
         )
-
-        db.add(log_entry)
-        db.commit()
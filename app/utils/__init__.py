@@ -1,4 +1,5 @@
 """Utility functions"""
+from app.utils.responses import ORJSONResponse
 from app.utils.session_id import generate_session_id
 
-__all__ = ["generate_session_id"]
+__all__ = ["ORJSONResponse", "generate_session_id"]
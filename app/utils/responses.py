@@ -0,0 +1,17 @@
+"""Response classes"""
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson (handles datetime natively)"""
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return orjson.dumps(content)
+        except TypeError:
+            # Values orjson can't encode (e.g. integers over 64 bits) go through the standard encoder
+            return super().render(jsonable_encoder(content))
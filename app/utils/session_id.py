@@ -1,7 +1,10 @@
 """Session ID generation utilities"""
-import hashlib
+from functools import lru_cache
+from hashlib import sha256
 
 
+# Flussonic re-checks the same (stream, ip, token) every few minutes, so most calls are cache hits
+@lru_cache(maxsize=65536)
 def generate_session_id(stream_name: str, client_ip: str, token: str) -> str:
     """
     Generate session ID using Flussonic's method: hash(name + ip + token)
@@ -14,5 +17,4 @@ def generate_session_id(stream_name: str, client_ip: str, token: str) -> str:
     Returns:
         SHA256 hash of combined parameters
     """
-    combined = f"{stream_name}{client_ip}{token}"
-    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+    return sha256(f"{stream_name}{client_ip}{token}".encode()).hexdigest()
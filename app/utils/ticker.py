@@ -0,0 +1,59 @@
+"""Shared scheduler for periodic background jobs"""
+import asyncio
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+TICK_SECONDS = 1.0
+
+Job = Callable[[], None] | Callable[[], Awaitable[None]]
+
+
+async def ticker(jobs: list[tuple[int, Job]]) -> None:
+    """
+    Run periodic jobs from a single one-second tick.
+
+    Ticks are scheduled against fixed monotonic deadlines, so job duration
+    does not cause drift. Blocking callables run in worker threads and coroutine
+    functions run on the event loop; a job still running from a previous period
+    is not started again.
+
+    Args:
+        jobs: List of (period_seconds, job) pairs
+    """
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    tick = 0
+    running: dict[Job, asyncio.Task[None]] = {}
+
+    try:
+        while True:
+            next_tick += TICK_SECONDS
+            tick += 1
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+            for period, job in jobs:
+                if tick % period:
+                    continue
+                task = running.get(job)
+                if task is not None and not task.done():
+                    continue
+                running[job] = asyncio.create_task(_run_job(job))
+
+    except asyncio.CancelledError:
+        # Let in-flight jobs finish so shutdown doesn't race them
+        await asyncio.gather(*running.values(), return_exceptions=True)
+        raise
+
+
+async def _run_job(job: Job) -> None:
+    """Run a job (blocking ones in a worker thread), logging unexpected errors."""
+    try:
+        if inspect.iscoroutinefunction(job):
+            await job()
+        else:
+            await asyncio.to_thread(job)
+    except Exception as e:
+        logger.error("Unexpected error in periodic job %s: %s", job.__name__, e, exc_info=True)